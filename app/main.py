@@ -24,7 +24,7 @@ import re
 import sys
 import time
 from collections import defaultdict
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set, Callable
@@ -83,6 +83,8 @@ class CrawlConfig:
     deduplicate: bool = True
     javascript: bool = False
     headers: Dict[str, str] = field(default_factory=dict)
+    json_encoder: Optional[Callable[[Any], Any]] = None  # e.g. orjson.dumps; str or bytes output
+    skip_mkdir: bool = False  # output_dir already created by the caller
     
 
 @dataclass
@@ -120,22 +122,20 @@ class RateLimiter:
         self.delay = delay
         self.max_delay = max_delay
         self.domain_delays: Dict[str, float] = defaultdict(lambda: delay)
-        self.last_request: Dict[str, float] = {}
-        self.lock = asyncio.Lock()
+        self.next_slot: Dict[str, float] = {}
     
     async def wait(self, url: str):
         """Wait appropriate time before request."""
         domain = urlparse(url).netloc
         
-        async with self.lock:
-            last = self.last_request.get(domain, 0)
-            delay = self.domain_delays[domain]
-            elapsed = time.time() - last
-            
-            if elapsed < delay:
-                await asyncio.sleep(delay - elapsed)
-            
-            self.last_request[domain] = time.time()
+        # Reserve this domain's next slot without awaiting, so the check-and-set
+        # is atomic on the event loop and a sleeping domain never blocks others
+        now = time.monotonic()
+        start = max(now, self.next_slot.get(domain, now))
+        self.next_slot[domain] = start + self.domain_delays[domain]
+        
+        if start > now:
+            await asyncio.sleep(start - now)
     
     def increase_delay(self, url: str):
         """Increase delay for domain (backoff)."""
@@ -157,8 +157,13 @@ class RobotsCache:
         self.parsers: Dict[str, RobotFileParser] = {}
         self.lock = asyncio.Lock()
     
-    async def can_fetch(self, url: str, user_agent: str, session: aiohttp.ClientSession) -> bool:
-        """Check if URL can be fetched according to robots.txt."""
+    async def can_fetch(self, url: str, user_agent: str, session: aiohttp.ClientSession,
+                        headers: Optional[Dict[str, str]] = None) -> bool:
+        """Check if URL can be fetched according to robots.txt.
+        
+        Pass `headers` when the session is shared, so robots.txt is requested
+        with this crawl's User-Agent rather than the session's defaults.
+        """
         domain = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
         
         async with self.lock:
@@ -167,7 +172,7 @@ class RobotsCache:
                 robots_url = f"{domain}/robots.txt"
                 
                 try:
-                    async with session.get(robots_url, timeout=10) as resp:
+                    async with session.get(robots_url, timeout=10, headers=headers) as resp:
                         if resp.status == 200:
                             content = await resp.text()
                             parser.parse(content.splitlines())
@@ -451,15 +456,15 @@ class ContentExtractor:
 class WebCrawler:
     """Modern async web crawler with advanced features."""
     
-    def __init__(self, config: CrawlConfig):
+    def __init__(self, config: CrawlConfig, session: Optional[aiohttp.ClientSession] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self.config = config
-        self.visited: Set[str] = set()
-        self.queued: Set[str] = set()
-        self.content_hashes: Set[str] = set()
-        self.results: List[PageData] = []
+        self.session = session  # Optional shared session, owned by the caller
+        self._request_kwargs: Dict[str, Any] = {}
+        self._owns_rate_limiter = rate_limiter is None
         
         # Components
-        self.rate_limiter = RateLimiter(config.delay)
+        self.rate_limiter = rate_limiter or RateLimiter(config.delay)
         self.robots_cache = RobotsCache()
         self.extractor = ContentExtractor()
         
@@ -467,6 +472,15 @@ class WebCrawler:
         self.setup_logging()
         self.console = Console()
         
+        self._reset_run_state()
+    
+    def _reset_run_state(self):
+        """Clear per-crawl state so one instance can run several crawls."""
+        self.visited: Set[str] = set()
+        self.queued: Set[str] = set()
+        self.content_hashes: Set[str] = set()
+        self.results: List[PageData] = []
+        
         # Stats
         self.stats = {
             'start_time': time.time(),
@@ -499,8 +513,26 @@ class WebCrawler:
         
         self.logger = logging.getLogger('SimpleCrawler')
     
-    async def crawl(self) -> Dict[str, Any]:
-        """Main crawl orchestration."""
+    async def crawl(self, **overrides) -> Dict[str, Any]:
+        """Main crawl orchestration; overrides (e.g. start_url=...) apply to this and later runs."""
+        await self.crawl_pages(**overrides)
+        
+        # Save and summarize
+        await self._save_results()
+        summary = self._generate_summary()
+        
+        self._display_summary(summary)
+        
+        return summary
+    
+    async def crawl_pages(self, **overrides) -> List[PageData]:
+        """Crawl and return the in-memory pages without exporting them."""
+        if overrides:
+            self.config = replace(self.config, **overrides)
+            if 'delay' in overrides and self._owns_rate_limiter:
+                self.rate_limiter = RateLimiter(self.config.delay)
+        self._reset_run_state()
+        
         self.logger.info(f"[bold green]Starting crawl of {self.config.start_url}[/bold green]")
         
         # Create session
@@ -510,46 +542,53 @@ class WebCrawler:
             **self.config.headers
         }
         
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            # Initialize queue
-            queue = asyncio.Queue()
-            await queue.put((self.config.start_url, 0))
-            self.queued.add(self.config.start_url)
-            
-            # Progress tracking
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeRemainingColumn(),
-            ) as progress:
-                
-                task = progress.add_task(
-                    "[cyan]Crawling...", 
-                    total=self.config.max_pages
-                )
-                
-                # Worker tasks
-                workers = [
-                    asyncio.create_task(self._worker(session, queue, progress, task))
-                    for _ in range(self.config.max_concurrent)
-                ]
-                
-                # Wait for completion
-                await queue.join()
-                
-                # Cancel workers
-                for worker in workers:
-                    worker.cancel()
-        
-        # Save and summarize
-        await self._save_results()
-        summary = self._generate_summary()
-        
-        self._display_summary(summary)
+        if self.session is not None:
+            # Shared session: apply this crawl's headers and timeout per request
+            self._request_kwargs = {'headers': headers, 'timeout': timeout}
+            await self._run_workers(self.session)
+        else:
+            async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+                await self._run_workers(session)
         
-        return summary
+        return self.results
+    
+    async def _run_workers(self, session: aiohttp.ClientSession):
+        """Run the worker pool over the URL queue until it drains."""
+        # Initialize queue
+        queue = asyncio.Queue()
+        await queue.put((self.config.start_url, 0))
+        self.queued.add(self.config.start_url)
+        
+        # Progress tracking. Rich allows one live display per console, so each
+        # crawler draws on its own and only when verbose; concurrent crawls in
+        # one process (e.g. the worker service) would otherwise collide
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=self.console,
+            disable=not self.config.verbose,
+        ) as progress:
+            
+            task = progress.add_task(
+                "[cyan]Crawling...", 
+                total=self.config.max_pages
+            )
+            
+            # Worker tasks
+            workers = [
+                asyncio.create_task(self._worker(session, queue, progress, task))
+                for _ in range(self.config.max_concurrent)
+            ]
+            
+            # Wait for completion
+            await queue.join()
+            
+            # Cancel workers
+            for worker in workers:
+                worker.cancel()
     
     async def _worker(self, session: aiohttp.ClientSession, queue: asyncio.Queue, progress, task):
         """Worker coroutine to process URLs."""
@@ -600,7 +639,10 @@ class WebCrawler:
         
         # Check robots.txt
         if self.config.respect_robots:
-            can_fetch = await self.robots_cache.can_fetch(url, self.config.user_agent, session)
+            can_fetch = await self.robots_cache.can_fetch(
+                url, self.config.user_agent, session,
+                headers=self._request_kwargs.get('headers')
+            )
             if not can_fetch:
                 self.logger.warning(f"Blocked by robots.txt: {url}")
                 self.stats['robots_blocked'] += 1
@@ -655,7 +697,8 @@ class WebCrawler:
             try:
                 start_time = time.time()
                 
-                async with session.get(url, allow_redirects=self.config.follow_redirects) as response:
+                async with session.get(url, allow_redirects=self.config.follow_redirects,
+                                       **self._request_kwargs) as response:
                     load_time = time.time() - start_time
                     
                     # Check content type
@@ -708,18 +751,27 @@ class WebCrawler:
     
     async def _save_results(self):
         """Save results in specified format."""
-        output_dir = Path(self.config.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await self.export(self.results, self.config.export_format, self.config.output_dir)
+    
+    async def export(self, pages: List[PageData], fmt: str, output_dir: str):
+        """Save pages in any export format, e.g. every format from one crawl_pages() run."""
+        output_dir = Path(output_dir)
+        if not self.config.skip_mkdir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.results = pages
         
-        if self.config.export_format == 'markdown':
+        if fmt == 'markdown':
             await self._save_markdown(output_dir)
-        elif self.config.export_format == 'json':
+        elif fmt == 'json':
             await self._save_json(output_dir)
-        elif self.config.export_format == 'csv':
+        elif fmt == 'csv':
             await self._save_csv(output_dir)
-        elif self.config.export_format == 'readable':
+        elif fmt == 'sqlite':
+            await self._save_sqlite(output_dir)
+        elif fmt == 'readable':
             await self._save_readable(output_dir)
-        elif self.config.export_format == 'summary':
+        elif fmt == 'summary':
             await self._save_summary(output_dir)
         
         self.logger.info(f"Results saved to {output_dir}")
@@ -741,8 +793,15 @@ class WebCrawler:
         
         data = [asdict(result) for result in self.results]
         
+        if self.config.json_encoder:
+            payload = self.config.json_encoder(data)
+            if isinstance(payload, bytes):
+                payload = payload.decode('utf-8')
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False)
+        
         async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+            await f.write(payload)
     
     async def _save_csv(self, output_dir: Path):
         """Save as CSV."""
@@ -763,6 +822,37 @@ class WebCrawler:
                     row['keywords'] = '; '.join(row['keywords'])
                     writer.writerow(row)
     
+    async def _save_sqlite(self, output_dir: Path):
+        """Save all pages into a single SQLite archive keyed by URL."""
+        filepath = output_dir / 'crawl_results.db'
+        
+        rows = [
+            (r.url, r.title, r.depth, r.word_count, r.crawled_at, 'markdown', self._to_markdown(r))
+            for r in self.results
+        ]
+        
+        # sqlite3 is blocking; keep it off the event loop shared by other crawls
+        await asyncio.to_thread(self._write_sqlite, filepath, rows)
+    
+    @staticmethod
+    def _write_sqlite(filepath: Path, rows: List[tuple]):
+        """Write page rows in one file and one transaction instead of a file per page."""
+        import sqlite3
+        
+        conn = sqlite3.connect(filepath)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pages ("
+                    "url TEXT PRIMARY KEY, title TEXT, depth INTEGER, word_count INTEGER, "
+                    "crawled_at TEXT, format TEXT, content TEXT)"
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+        finally:
+            conn.close()
+    
     async def _save_readable(self, output_dir: Path):
         """Save as human-readable text format optimized for LLMs."""
         # Single consolidated file for easy reading
@@ -1081,7 +1171,7 @@ def main():
     
     # Output
     parser.add_argument("--output-dir", default="crawled_pages", help="Output directory")
-    parser.add_argument("--format", choices=['markdown', 'json', 'csv', 'readable', 'summary'], default='markdown', help="Export format")
+    parser.add_argument("--format", choices=['markdown', 'json', 'csv', 'sqlite', 'readable', 'summary'], default='markdown', help="Export format")
     
     # Features
     parser.add_argument("--images", action="store_true", help="Extract images")
@@ -1089,7 +1179,7 @@ def main():
     parser.add_argument("--no-robots", action="store_true", help="Ignore robots.txt")
     
     # Logging
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging and live progress display")
     parser.add_argument("--debug", action="store_true", help="Debug logging")
     
     args = parser.parse_args()
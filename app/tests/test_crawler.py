@@ -46,6 +46,34 @@ class TestWebCrawlerInitialization:
         assert 'start_time' in crawler.stats
         assert 'pages_crawled' in crawler.stats
         assert crawler.stats['pages_crawled'] == 0
+    
+    def test_crawler_accepts_shared_session(self, basic_config):
+        """Test crawler keeps a caller-provided session for reuse."""
+        session = MagicMock(spec=aiohttp.ClientSession)
+        crawler = WebCrawler(basic_config, session=session)
+        
+        assert crawler.session is session
+        assert WebCrawler(basic_config).session is None
+    
+    @pytest.mark.asyncio
+    async def test_crawl_overrides_reuse_instance(self, basic_config, temp_output_dir):
+        """Test one crawler can run several sites with per-call overrides."""
+        crawler = WebCrawler(basic_config)
+        crawler.visited.add('http://stale.example.com')
+        
+        with patch.object(crawler, '_run_workers', AsyncMock()) as run_workers:
+            pages = await crawler.crawl_pages(
+                start_url='http://other.com',
+                output_dir=str(temp_output_dir / 'other'),
+                max_pages=3
+            )
+        
+        run_workers.assert_awaited_once()
+        assert pages == []
+        assert crawler.config.start_url == 'http://other.com'
+        assert crawler.config.max_pages == 3
+        assert basic_config.start_url != 'http://other.com'
+        assert len(crawler.visited) == 0
 
 
 class TestURLFiltering:
@@ -173,6 +201,95 @@ class TestContentExtraction:
         assert metadata['title'] == 'Empty Page'
 
 
+class TestExport:
+    """Test result export options."""
+    
+    @pytest.mark.asyncio
+    async def test_json_export_uses_custom_encoder(self, temp_output_dir):
+        """Test a configured json_encoder replaces the stdlib encoder."""
+        calls = []
+        
+        def encoder(data):
+            calls.append(data)
+            return b'[]'
+        
+        config = CrawlConfig(
+            start_url='http://example.com',
+            output_dir=str(temp_output_dir),
+            export_format='json',
+            json_encoder=encoder
+        )
+        crawler = WebCrawler(config)
+        crawler.results = [
+            PageData(url='http://example.com', title='Test', depth=0,
+                     content='Test content', html='<html></html>')
+        ]
+        
+        await crawler._save_results()
+        
+        assert len(calls) == 1
+        assert calls[0][0]['url'] == 'http://example.com'
+        assert (Path(temp_output_dir) / 'crawl_results.json').read_text() == '[]'
+    
+    @pytest.mark.asyncio
+    async def test_skip_mkdir_leaves_output_dir_alone(self, temp_output_dir):
+        """Test skip_mkdir trusts the caller to have created output_dir."""
+        config = CrawlConfig(
+            start_url='http://example.com',
+            output_dir=str(temp_output_dir / 'missing'),
+            export_format='json',
+            skip_mkdir=True
+        )
+        crawler = WebCrawler(config)
+        
+        with pytest.raises(FileNotFoundError):
+            await crawler._save_results()
+        assert not (temp_output_dir / 'missing').exists()
+    
+    @pytest.mark.asyncio
+    async def test_export_writes_several_formats_from_one_crawl(self, temp_output_dir):
+        """Test export() formats the same pages without re-crawling."""
+        crawler = WebCrawler(CrawlConfig(
+            start_url='http://example.com',
+            output_dir=str(temp_output_dir)
+        ))
+        pages = [
+            PageData(url='http://example.com', title='Test', depth=0,
+                     content='Test content', html='<html></html>')
+        ]
+        
+        await crawler.export(pages, 'json', temp_output_dir / 'json')
+        await crawler.export(pages, 'markdown', temp_output_dir / 'markdown')
+        
+        assert (temp_output_dir / 'json' / 'crawl_results.json').exists()
+        assert list((temp_output_dir / 'markdown').glob('*.md'))
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_export_single_archive(self, temp_output_dir):
+        """Test sqlite export stores every page in one database keyed by URL."""
+        import sqlite3
+        
+        crawler = WebCrawler(CrawlConfig(
+            start_url='http://example.com',
+            output_dir=str(temp_output_dir),
+            export_format='sqlite'
+        ))
+        crawler.results = [
+            PageData(url=f'http://example.com/{i}', title=f'Page {i}', depth=1,
+                     content='Test content', html='<html></html>')
+            for i in range(3)
+        ]
+        
+        await crawler._save_results()
+        
+        conn = sqlite3.connect(temp_output_dir / 'crawl_results.db')
+        rows = conn.execute("SELECT url, format, content FROM pages ORDER BY url").fetchall()
+        conn.close()
+        
+        assert [row[0] for row in rows] == [f'http://example.com/{i}' for i in range(3)]
+        assert all(row[1] == 'markdown' and 'Test content' in row[2] for row in rows)
+
+
 class TestRateLimiter:
     """Test rate limiting functionality."""
     
@@ -203,6 +320,27 @@ class TestRateLimiter:
         # Should be nearly instant (different domains)
         assert elapsed < 0.1
     
+    @pytest.mark.asyncio
+    async def test_rate_limiter_sleeping_domain_does_not_block_others(self):
+        """Test a domain waiting out its delay does not hold up other domains."""
+        limiter = RateLimiter(delay=0.2)
+        await limiter.wait('http://example1.com')
+        
+        start = asyncio.get_event_loop().time()
+        blocked = asyncio.create_task(limiter.wait('http://example1.com'))
+        await asyncio.sleep(0)
+        await limiter.wait('http://example2.com')
+        elapsed = asyncio.get_event_loop().time() - start
+        await blocked
+        
+        assert elapsed < 0.1
+    
+    def test_crawler_accepts_shared_rate_limiter(self, basic_config):
+        """Test crawlers can share one limiter for per-host politeness."""
+        limiter = RateLimiter(delay=0.1)
+        
+        assert WebCrawler(basic_config, rate_limiter=limiter).rate_limiter is limiter
+    
     @pytest.mark.asyncio
     async def test_rate_limiter_backoff(self):
         """Test exponential backoff on errors."""
@@ -280,6 +418,29 @@ class TestRobotsCache:
         )
         
         assert can_fetch is False
+    
+    @pytest.mark.asyncio
+    async def test_robots_fetch_uses_crawl_headers(self, robots_txt_allow_all):
+        """Test robots.txt is requested with the crawl's headers on a shared session."""
+        cache = RobotsCache()
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value=robots_txt_allow_all)
+        
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        
+        headers = {'User-Agent': 'SimpleCrawler'}
+        await cache.can_fetch(
+            'http://example.com/any-path',
+            'SimpleCrawler',
+            mock_session,
+            headers=headers
+        )
+        
+        assert mock_session.get.call_args.kwargs['headers'] == headers
 
 
 class TestPageData:
@@ -332,3 +493,27 @@ class TestPageData:
         )
         
         assert page.word_count == 5
+
+
+class TestConcurrentCrawls:
+    """Test several crawlers sharing one process."""
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_crawls_both_complete(self, mock_server, temp_output_dir):
+        """Test two crawls running at once do not fight over the progress display."""
+        crawlers = [
+            WebCrawler(CrawlConfig(
+                start_url=mock_server,
+                max_pages=3,
+                max_depth=1,
+                delay=0.1,
+                output_dir=str(temp_output_dir / name),
+                export_format='json'
+            ))
+            for name in ('first', 'second')
+        ]
+        
+        summaries = await asyncio.gather(*(crawler.crawl() for crawler in crawlers))
+        
+        for summary in summaries:
+            assert summary['stats']['pages_crawled'] > 0
@@ -8,10 +8,14 @@ This agent can gather information from multiple sources and synthesize research.
 """
 
 import asyncio
+import heapq
 import json
+import zlib
+from collections import namedtuple
 from typing import List, Dict, Any
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from urllib.parse import urldefrag, urlsplit, urlunsplit
 
 # Import SimpleCrawler client (assuming it's installed)
 try:
@@ -19,6 +23,21 @@ try:
 except ImportError:
     print("SimpleCrawler client not installed. Using mock client for demo.")
     
+    # Mock result types and payload, built once at import
+    _Job = namedtuple('_Job', ('job_id', 'status'))
+    _Results = namedtuple('_Results', ('pages',))
+    
+    _MOCK_PAGES = [
+        {
+            'url': 'https://example.com/page1',
+            'title': 'Sample Documentation',
+            'content': 'This is sample content from the crawled page.',
+            'summary': 'Key points about the topic with important information.',
+            'code_examples': ['print("Hello World")'],
+            'word_count': 250
+        }
+    ]
+    
     # Mock client for demonstration
     class MockCrawlerClient:
         def __init__(self, base_url: str):
@@ -26,31 +45,33 @@ except ImportError:
         
         async def crawl(self, start_url: str, **kwargs):
             # Return mock job
-            return type('Job', (), {
-                'job_id': f"job_{hash(start_url) % 10000}",
-                'status': 'pending'
-            })()
+            return _Job(f"job_{zlib.crc32(start_url.encode()) % 10000}", 'pending')
         
         async def wait_for_completion(self, job_id: str):
             # Return mock results
-            return type('Results', (), {
-                'pages': [
-                    {
-                        'url': 'https://example.com/page1',
-                        'title': 'Sample Documentation',
-                        'content': 'This is sample content from the crawled page.',
-                        'summary': 'Key points about the topic with important information.',
-                        'code_examples': ['print("Hello World")'],
-                        'word_count': 250
-                    }
-                ]
-            })()
+            return _Results(pages=_MOCK_PAGES)
+        
+        async def aclose(self):
+            # Nothing to release for the mock
+            pass
     
     AsyncCrawlerClient = MockCrawlerClient
     CrawlerClient = MockCrawlerClient
 
 
-@dataclass
+# Content pages considered when extracting key findings
+MAX_FINDING_PAGES = 20
+
+
+def _canon(url: str) -> str:
+    """Canonicalize a source URL so equivalent pages map to one crawl."""
+    url, _ = urldefrag(url)
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+@dataclass(slots=True)
 class ResearchTask:
     """Represents a research task with sources and parameters."""
     topic: str
@@ -60,7 +81,7 @@ class ResearchTask:
     max_pages_per_source: int = 20
 
 
-@dataclass 
+@dataclass(slots=True)
 class ResearchResult:
     """Contains synthesized research results."""
     topic: str
@@ -91,6 +112,18 @@ class AIResearchAgent:
         self.crawler = AsyncCrawlerClient(crawler_url)
         self.research_history = []
     
+    async def __aenter__(self) -> "AIResearchAgent":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the crawler client and release its pooled connections."""
+        close = getattr(self.crawler, 'aclose', None)
+        if close is not None:
+            await close()
+    
     async def research_topic(self, task: ResearchTask) -> ResearchResult:
         """
         Perform comprehensive research on a topic.
@@ -102,15 +135,28 @@ class AIResearchAgent:
             ResearchResult with synthesized findings
         """
         print(f"🔍 Starting research on: {task.topic}")
-        print(f"📚 Sources to crawl: {len(task.sources)}")
+        
+        # Collapse duplicate sources (fragments, trailing slashes, host case)
+        # so every page is crawled once
+        canonical = {source: _canon(source) for source in task.sources}
+        unique_sources = list(dict.fromkeys(canonical.values()))
+        
+        print(f"📚 Sources to crawl: {len(unique_sources)}")
+        if len(unique_sources) < len(task.sources):
+            seen = set()
+            for source in task.sources:
+                canon = canonical[source]
+                if canon in seen:
+                    print(f"   🔗 Skipping duplicate {source} (same as {canon})")
+                seen.add(canon)
         
         # Determine crawl parameters based on task depth
         crawl_params = self._get_crawl_parameters(task)
         
         # Start parallel crawls for all sources
         crawl_jobs = []
-        for i, source in enumerate(task.sources):
-            print(f"   🌐 Starting crawl {i+1}/{len(task.sources)}: {source}")
+        for i, source in enumerate(unique_sources):
+            print(f"   🌐 Starting crawl {i+1}/{len(unique_sources)}: {source}")
             
             job = await self.crawler.crawl(
                 start_url=source,
@@ -119,22 +165,31 @@ class AIResearchAgent:
             )
             crawl_jobs.append((source, job))
         
-        # Wait for all crawls to complete and collect results
+        # Wait for all crawls concurrently so total wait tracks the slowest
+        # job rather than the sum of every job's completion time
+        for source, _ in crawl_jobs:
+            print(f"   ⏳ Waiting for completion: {source}")
+        
+        outcomes = await asyncio.gather(
+            *(self.crawler.wait_for_completion(job.job_id) for _, job in crawl_jobs),
+            return_exceptions=True
+        )
+        
         all_pages = []
         sources_completed = 0
         
-        for source, job in crawl_jobs:
-            try:
-                print(f"   ⏳ Waiting for completion: {source}")
-                results = await self.crawler.wait_for_completion(job.job_id)
-                all_pages.extend(results.pages)
-                sources_completed += 1
-                print(f"   ✅ Completed {source}: {len(results.pages)} pages")
-            except Exception as e:
-                print(f"   ❌ Failed {source}: {e}")
+        for (source, _), results in zip(crawl_jobs, outcomes):
+            if isinstance(results, BaseException):
+                print(f"   ❌ Failed {source}: {results}")
+                continue
+            all_pages.extend(results.pages)
+            sources_completed += 1
+            print(f"   ✅ Completed {source}: {len(results.pages)} pages")
         
         # Synthesize research from collected data
-        research_result = await self._synthesize_research(task, all_pages, sources_completed)
+        research_result = await self._synthesize_research(
+            task, all_pages, sources_completed, len(unique_sources)
+        )
         
         # Store in research history
         self.research_history.append(research_result)
@@ -194,7 +249,8 @@ class AIResearchAgent:
         self, 
         task: ResearchTask, 
         pages: List[Dict[str, Any]], 
-        sources_count: int
+        sources_count: int,
+        total_sources: int
     ) -> ResearchResult:
         """Synthesize research results from crawled pages."""
         
@@ -206,7 +262,7 @@ class AIResearchAgent:
         
         # Calculate confidence score based on various factors
         confidence_score = self._calculate_confidence_score(
-            pages, sources_count, len(task.sources)
+            pages, sources_count, total_sources
         )
         
         return ResearchResult(
@@ -222,20 +278,42 @@ class AIResearchAgent:
         )
     
     def _extract_key_findings(self, pages: List[Dict], topic: str) -> List[str]:
-        """Extract key findings related to the research topic."""
-        findings = []
+        """Extract the key findings most relevant to the research topic."""
+        topic_lower = topic.lower()
+        terms = topic_lower.split()
+        
+        # (topic term hits, -position, finding); position breaks ties in
+        # first-seen order
+        candidates = []
+        
+        # Score content pages once with a C-level substring count and only
+        # split the best-matching ones into sentences
+        content_pages = [
+            (page['content'].lower().count(topic_lower), -i)
+            for i, page in enumerate(pages)
+            if 'summary' not in page and 'content' in page
+        ]
+        top_pages = {
+            -neg_i for hits, neg_i in heapq.nlargest(MAX_FINDING_PAGES, content_pages)
+            if hits
+        }
         
-        for page in pages:
+        for i, page in enumerate(pages):
             # Look for summary or key points in page content
             if 'summary' in page:
-                findings.append(f"From {page.get('title', 'Unknown')}: {page['summary']}")
-            elif 'content' in page and topic.lower() in page['content'].lower():
+                summary = page['summary']
+                hits = sum(summary.lower().count(term) for term in terms)
+                candidates.append((hits, -len(candidates), f"From {page.get('title', 'Unknown')}: {summary}"))
+            elif i in top_pages:
                 # Extract sentences containing the topic
                 sentences = page['content'].split('.')
-                relevant = [s.strip() for s in sentences if topic.lower() in s.lower()]
-                findings.extend(relevant[:2])  # Top 2 relevant sentences
+                relevant = [s.strip() for s in sentences if topic_lower in s.lower()]
+                for sentence in relevant[:2]:  # Top 2 relevant sentences
+                    hits = sum(sentence.lower().count(term) for term in terms)
+                    candidates.append((hits, -len(candidates), sentence))
         
-        return findings[:10]  # Limit to top 10 findings
+        # Top 10 findings by relevance
+        return [finding for _, _, finding in heapq.nlargest(10, candidates)]
     
     def _extract_technical_details(self, pages: List[Dict]) -> List[Dict[str, Any]]:
         """Extract technical details like APIs, configurations, etc."""
@@ -324,7 +402,7 @@ class AIResearchAgent:
         if format == "markdown":
             return self._export_markdown(result)
         elif format == "json":
-            return json.dumps(result.__dict__, default=str, indent=2)
+            return json.dumps(asdict(result), default=str, indent=2)
         elif format == "summary":
             return self._export_summary(result)
         else:
@@ -392,9 +470,6 @@ async def demo_research_agent():
     print("🤖 SimpleCrawler MK4 - AI Research Agent Demo")
     print("=" * 50)
     
-    # Initialize the agent
-    agent = AIResearchAgent()
-    
     # Define research tasks
     research_tasks = [
         ResearchTask(
@@ -420,29 +495,31 @@ async def demo_research_agent():
         )
     ]
     
-    # Execute research tasks
-    for task in research_tasks:
-        print(f"\n🎯 Research Task: {task.topic}")
-        print("-" * 40)
-        
-        try:
-            result = await agent.research_topic(task)
-            
-            # Export results
-            print("\n📄 Markdown Report:")
-            print("=" * 20)
-            markdown_report = agent.export_research(result, "markdown")
-            print(markdown_report[:500] + "..." if len(markdown_report) > 500 else markdown_report)
+    # Initialize the agent; one client (and connection pool) serves every task
+    async with AIResearchAgent() as agent:
+        # Execute research tasks
+        for task in research_tasks:
+            print(f"\n🎯 Research Task: {task.topic}")
+            print("-" * 40)
             
-            print("\n📋 Executive Summary:")
-            print("=" * 20)
-            summary = agent.export_research(result, "summary")
-            print(summary)
-            
-        except Exception as e:
-            print(f"❌ Research failed: {e}")
-    
-    print(f"\n🎉 Demo completed! Total research history: {len(agent.research_history)} tasks")
+            try:
+                result = await agent.research_topic(task)
+                
+                # Export results
+                print("\n📄 Markdown Report:")
+                print("=" * 20)
+                markdown_report = agent.export_research(result, "markdown")
+                print(markdown_report[:500] + "..." if len(markdown_report) > 500 else markdown_report)
+                
+                print("\n📋 Executive Summary:")
+                print("=" * 20)
+                summary = agent.export_research(result, "summary")
+                print(summary)
+                
+            except Exception as e:
+                print(f"❌ Research failed: {e}")
+        
+        print(f"\n🎉 Demo completed! Total research history: {len(agent.research_history)} tasks")
 
 
 if __name__ == "__main__":
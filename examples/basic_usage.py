@@ -7,12 +7,14 @@ import asyncio
 import sys
 from pathlib import Path
 
+import aiohttp
+
 # Add app to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'app'))
 
 from app import CrawlConfig, WebCrawler
 
-async def basic_crawl_example():
+async def basic_crawl_example(session: aiohttp.ClientSession):
     """Basic crawling example."""
     print("🕷️ Basic Crawl Example")
     
@@ -24,13 +26,13 @@ async def basic_crawl_example():
         verbose=True
     )
     
-    crawler = WebCrawler(config)
+    crawler = WebCrawler(config, session=session)
     summary = await crawler.crawl()
     
     print(f"✅ Crawled {summary['stats']['pages_crawled']} pages")
     return summary
 
-async def documentation_crawl_example():
+async def documentation_crawl_example(session: aiohttp.ClientSession):
     """Documentation site crawling example."""
     print("📚 Documentation Crawl Example")
     
@@ -46,13 +48,13 @@ async def documentation_crawl_example():
         extract_images=False  # Focus on text content
     )
     
-    crawler = WebCrawler(config)
+    crawler = WebCrawler(config, session=session)
     summary = await crawler.crawl()
     
     print(f"✅ Crawled {summary['stats']['pages_crawled']} documentation pages")
     return summary
 
-async def fast_shallow_crawl():
+async def fast_shallow_crawl(session: aiohttp.ClientSession):
     """Fast shallow crawl for site overview."""
     print("⚡ Fast Shallow Crawl Example")
     
@@ -68,13 +70,13 @@ async def fast_shallow_crawl():
         verbose=True
     )
     
-    crawler = WebCrawler(config)
+    crawler = WebCrawler(config, session=session)
     summary = await crawler.crawl()
     
     print(f"✅ Fast crawl completed: {summary['stats']['pages_crawled']} pages")
     return summary
 
-async def comprehensive_crawl():
+async def comprehensive_crawl(session: aiohttp.ClientSession):
     """Comprehensive crawl with all features."""
     print("🔍 Comprehensive Crawl Example")
     
@@ -94,7 +96,7 @@ async def comprehensive_crawl():
         timeout=20
     )
     
-    crawler = WebCrawler(config)
+    crawler = WebCrawler(config, session=session)
     summary = await crawler.crawl()
     
     print(f"✅ Comprehensive crawl: {summary['stats']['pages_crawled']} pages")
@@ -109,27 +111,37 @@ async def main():
     Path('examples/output').mkdir(parents=True, exist_ok=True)
     
     examples = [
-        ("Basic Crawl", basic_crawl_example),
-        ("Documentation Site", documentation_crawl_example), 
-        ("Fast Shallow", fast_shallow_crawl),
-        ("Comprehensive", comprehensive_crawl)
+        ("Basic Crawl", basic_crawl_example, "example.com"),
+        ("Documentation Site", documentation_crawl_example, "requests.readthedocs.io"), 
+        ("Fast Shallow", fast_shallow_crawl, "fastapi.tiangolo.com"),
+        ("Comprehensive", comprehensive_crawl, "rich.readthedocs.io")
     ]
     
     results = {}
     
-    for name, example_func in examples:
-        try:
-            print(f"\n{'='*50}")
-            result = await example_func()
-            results[name] = result
-            print(f"✅ {name} completed successfully")
-            
-            # Wait between examples to be respectful
-            await asyncio.sleep(2)
+    # One connection pool for every example: no repeated DNS lookups or
+    # TLS handshakes between crawls. Cap connections per host so the
+    # shared pool stays polite, and cache DNS for the whole run
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        prev_host = None
+        
+        for name, example_func, host in examples:
+            # Be respectful: only pause between back-to-back crawls of one
+            # host, each crawl already applies its own per-request delay
+            if host == prev_host:
+                await asyncio.sleep(2)
+            prev_host = host
             
-        except Exception as e:
-            print(f"❌ {name} failed: {e}")
-            results[name] = None
+            try:
+                print(f"\n{'='*50}")
+                result = await example_func(session)
+                results[name] = result
+                print(f"✅ {name} completed successfully")
+                
+            except Exception as e:
+                print(f"❌ {name} failed: {e}")
+                results[name] = None
     
     # Summary
     print(f"\n{'='*50}")
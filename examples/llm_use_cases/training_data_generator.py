@@ -9,12 +9,102 @@ Optimized for clean text extraction, proper formatting, and structured datasets.
 
 import asyncio
 import json
+import math
 import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 
+# Optional dependencies
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    HAS_DATASKETCH = True
+except ImportError:
+    HAS_DATASKETCH = False
+
+# Near-duplicate detection (MinHash-LSH over token shingles)
+LSH_THRESHOLD = 0.85
+LSH_NUM_PERM = 128
+SHINGLE_SIZE = 5
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Exact-dedup fingerprint covers only the head of the normalized token stream
+FINGERPRINT_CHARS = 4000
+
+# Line break plus the surrounding whitespace and any blank lines
+_LINE_BREAK_RE = re.compile(r"[^\S\n]*\n\s*")
+
+# Stop crawling once this many consecutive sources add almost nothing new
+NOVELTY_MIN_RATE = 0.05
+NOVELTY_WINDOW = 2
+
+# Sources crawled at once; later sources only start as earlier ones finish
+MAX_CONCURRENT_SOURCES = 3
+
+# Pages held in memory per batch while streaming a source
+STREAM_BATCH_PAGES = 256
+
+# Filtered pages in a batch before cleaning is farmed out to the process pool,
+# and how many pages each worker call handles
+PARALLEL_MIN_PAGES = 64
+PARALLEL_CHUNK_PAGES = 64
+
+# Examples needed before stats reductions go through the Numba kernel
+# (smaller datasets are not worth the one-off compile)
+NUMBA_MIN_EXAMPLES = 100_000
+
+# Bytes buffered per write when exporting JSONL
+JSONL_FLUSH_BYTES = 64 * 1024 * 1024
+
+# Rows per Parquet row group
+PARQUET_ROW_GROUP_ROWS = 8192
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize an object as compact UTF-8 JSON."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_line(row: Dict[str, Any]) -> bytes:
+    """Serialize a row as one UTF-8 JSON line."""
+    if HAS_ORJSON:
+        return orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE)
+    return _json_bytes(row) + b'\n'
+
+
 # Mock crawler client for demo
 class MockCrawlerClient:
     def __init__(self, base_url: str):
@@ -89,6 +179,10 @@ More
                 }
             ]
         })()
+    
+    async def iter_pages(self, job_id: str):
+        for page in (await self.wait_for_completion(job_id)).pages:
+            yield page
 
 try:
     from simplecrawler_client import AsyncCrawlerClient
@@ -96,7 +190,7 @@ except ImportError:
     AsyncCrawlerClient = MockCrawlerClient
 
 
-@dataclass
+@dataclass(slots=True)
 class TrainingExample:
     """Represents a single training example for LLMs."""
     text: str
@@ -106,12 +200,97 @@ class TrainingExample:
     quality_score: float
     category: str
     metadata: Dict[str, Any]
-    hash: str = ""
+    hash: int = 0
     
     def __post_init__(self):
         """Generate content hash for deduplication."""
         if not self.hash:
-            self.hash = hashlib.md5(self.text.encode()).hexdigest()
+            # Hash normalized tokens so whitespace/case variants collide
+            normalized = " ".join(_TOKEN_RE.findall(self.text.lower()))
+            data = normalized[:FINGERPRINT_CHARS].encode('utf-8')
+            # Dedup key only: a fast non-cryptographic hash is enough.
+            # Kept as an int so set lookups hash a number, not a hex string
+            if HAS_XXHASH:
+                self.hash = xxhash.xxh128(data).intdigest()
+            else:
+                self.hash = int.from_bytes(hashlib.md5(data).digest(), 'big')
+    
+    @property
+    def hash_hex(self) -> str:
+        """128-bit content hash as a hex string, for serialization."""
+        return f"{self.hash:032x}"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dict of the example's fields, without asdict()'s deep copy."""
+        return {
+            'text': self.text,
+            'source': self.source,
+            'title': self.title,
+            'word_count': self.word_count,
+            'quality_score': self.quality_score,
+            'category': self.category,
+            'metadata': self.metadata,
+            'hash': self.hash_hex
+        }
+
+
+class NearDuplicateIndex:
+    """Track seen examples and flag exact or near duplicates.
+    
+    Exact duplicates are caught by content hash. When datasketch is
+    installed, paraphrased or whitespace-variant texts are also caught with
+    MinHash-LSH over token shingles; otherwise only exact matching applies.
+    
+    Two texts whose lengths differ by more than a factor of ``threshold``
+    cannot reach that Jaccard similarity, so LSH indexes are kept per
+    geometric length bucket and each example only queries its own and the
+    adjacent buckets.
+    """
+    
+    def __init__(self, threshold: float = LSH_THRESHOLD, num_perm: int = LSH_NUM_PERM):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.seen_hashes = set()
+        self.lsh = {} if HAS_DATASKETCH else None
+        self.near_dup_suppressed = 0
+        self._bucket_log_ratio = -math.log(threshold)
+    
+    def add(self, example: TrainingExample) -> bool:
+        """Record an example; return False if it duplicates one already seen."""
+        if example.hash in self.seen_hashes:
+            return False
+        
+        if self.lsh is not None:
+            minhash = self._minhash(example.text)
+            bucket = self._length_bucket(example.word_count)
+            for neighbour in (bucket - 1, bucket, bucket + 1):
+                lsh = self.lsh.get(neighbour)
+                if lsh is not None and lsh.query(minhash):
+                    self.near_dup_suppressed += 1
+                    return False
+            
+            lsh = self.lsh.get(bucket)
+            if lsh is None:
+                lsh = self.lsh[bucket] = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
+            lsh.insert(example.hash, minhash)
+        
+        self.seen_hashes.add(example.hash)
+        return True
+    
+    def _length_bucket(self, word_count: int) -> int:
+        """Geometric length bucket; adjacent buckets span one threshold ratio."""
+        return int(math.log(max(word_count, 1)) / self._bucket_log_ratio)
+    
+    def _minhash(self, text: str) -> "MinHash":
+        """Build a MinHash signature over word shingles of the text."""
+        tokens = _TOKEN_RE.findall(text.lower())
+        shingles = {
+            ' '.join(tokens[i:i + SHINGLE_SIZE])
+            for i in range(max(1, len(tokens) - SHINGLE_SIZE + 1))
+        }
+        minhash = MinHash(num_perm=self.num_perm)
+        minhash.update_batch([shingle.encode('utf-8') for shingle in shingles])
+        return minhash
 
 
 @dataclass
@@ -126,6 +305,110 @@ class TrainingDataset:
     stats: Dict[str, Any]
 
 
+def _clean_content_for_training(content: str) -> str:
+    """Clean content for LLM training."""
+    
+    # Strip every line and drop empty lines in a single regex pass
+    cleaned = _LINE_BREAK_RE.sub('\n', content).strip()
+    
+    # Remove duplicate consecutive lines
+    return '\n'.join(line for line, _ in groupby(cleaned.split('\n')))
+
+
+def _numeric_columns(examples: List[TrainingExample]):
+    """Word-count and quality-score columns, as NumPy arrays when available."""
+    
+    if HAS_NUMPY:
+        n = len(examples)
+        return (
+            np.fromiter((ex.word_count for ex in examples), dtype=np.int64, count=n),
+            np.fromiter((ex.quality_score for ex in examples), dtype=np.float64, count=n)
+        )
+    
+    return [ex.word_count for ex in examples], [ex.quality_score for ex in examples]
+
+
+def _reduce_stats(word_counts, quality_scores):
+    """Sum, min and max of both numeric columns in one parallel pass."""
+    total_words, min_words, max_words = 0, word_counts[0], word_counts[0]
+    quality_total, min_quality, max_quality = 0.0, quality_scores[0], quality_scores[0]
+    for i in prange(word_counts.shape[0]):
+        words, quality = word_counts[i], quality_scores[i]
+        total_words += words
+        min_words = min(min_words, words)
+        max_words = max(max_words, words)
+        quality_total += quality
+        min_quality = min(min_quality, quality)
+        max_quality = max(max_quality, quality)
+    return total_words, min_words, max_words, quality_total, min_quality, max_quality
+
+
+if HAS_NUMBA:
+    _reduce_stats = njit(parallel=True, fastmath=True)(_reduce_stats)
+
+
+def _filter_pages(
+    pages: List[Dict[str, Any]],
+    quality_threshold: float,
+    max_words: int,
+    min_words: int
+) -> List[Dict[str, Any]]:
+    """Keep the pages that pass the quality and length thresholds."""
+    
+    if HAS_NUMPY:
+        # One vectorized comparison pass over the scalar columns
+        quality = np.fromiter((p.get('quality_score', 0.5) for p in pages), dtype=np.float64, count=len(pages))
+        words = np.fromiter((p.get('word_count', 0) for p in pages), dtype=np.int64, count=len(pages))
+        keep = (quality >= quality_threshold) & (words >= min_words) & (words <= max_words)
+        return [pages[i] for i in np.flatnonzero(keep)]
+    
+    return [
+        p for p in pages
+        if p.get('quality_score', 0.5) >= quality_threshold
+        and min_words <= p.get('word_count', 0) <= max_words
+    ]
+
+
+def _page_to_example(
+    page: Dict[str, Any],
+    source_config: Dict[str, Any],
+    min_words: int
+) -> Optional[TrainingExample]:
+    """Turn one filtered page into a training example, or None if too short once cleaned."""
+    
+    # Clean and normalize content
+    cleaned_content = _clean_content_for_training(page.get('content', ''))
+    cleaned_words = len(cleaned_content.split())
+    
+    if not cleaned_content or cleaned_words < min_words:
+        return None
+    
+    return TrainingExample(
+        text=cleaned_content,
+        source=page.get('url', ''),
+        title=page.get('title', ''),
+        word_count=cleaned_words,
+        quality_score=page.get('quality_score', 0.5),
+        category=source_config.get('category', 'general'),
+        metadata={
+            'source_domain': source_config.get('name', ''),
+            'crawled_at': datetime.now().isoformat(),
+            'reading_time': page.get('reading_time', 0),
+            'has_code': 'code_blocks' in page and len(page['code_blocks']) > 0
+        }
+    )
+
+
+def _pages_to_examples(
+    pages: List[Dict[str, Any]],
+    source_config: Dict[str, Any],
+    min_words: int
+) -> List[TrainingExample]:
+    """Turn a run of filtered pages into training examples, dropping the ones too short once cleaned."""
+    to_example = partial(_page_to_example, source_config=source_config, min_words=min_words)
+    return [example for example in map(to_example, pages) if example is not None]
+
+
 class LLMTrainingDataGenerator:
     """
     Generate high-quality training data for LLMs using SimpleCrawler MK4.
@@ -142,6 +425,7 @@ class LLMTrainingDataGenerator:
         """Initialize the training data generator."""
         self.crawler = AsyncCrawlerClient(crawler_url)
         self.datasets = []
+        self.dedup_index: Optional[NearDuplicateIndex] = None
     
     async def create_training_dataset(
         self,
@@ -170,48 +454,78 @@ class LLMTrainingDataGenerator:
         print(f"🏗️  Creating training dataset: {dataset_name}")
         print(f"📚 Processing {len(sources)} source collections")
         
-        all_examples = []
+        # Run a bounded number of sources at a time and dedup each one as it
+        # lands, so redundant trailing sources never get started
+        self.dedup_index = NearDuplicateIndex()
+        queued = iter(enumerate(sources))
+        running = set()
+        started = 0
+        stopping = False
         
-        # Process each source collection
-        for i, source_config in enumerate(sources):
-            print(f"\n📖 Processing source {i+1}/{len(sources)}: {source_config.get('name', 'Unknown')}")
-            
-            # Start crawl with training-optimized parameters
-            crawl_params = self._get_training_crawl_params(source_config)
-            
-            job = await self.crawler.crawl(
-                start_url=source_config['url'],
-                **crawl_params
-            )
-            
-            print(f"   🔄 Crawling started (Job: {job.job_id})")
-            results = await self.crawler.wait_for_completion(job.job_id)
-            
-            # Process pages into training examples
-            examples = self._process_pages_for_training(
-                results.pages,
-                source_config,
-                quality_threshold,
-                max_words_per_example,
-                min_words_per_example
-            )
-            
-            all_examples.extend(examples)
-            print(f"   ✅ Generated {len(examples)} training examples")
-        
-        # Deduplicate examples
-        unique_examples = self._deduplicate_examples(all_examples)
-        print(f"🔍 Deduplication: {len(all_examples)} → {len(unique_examples)} examples")
+        unique_examples = []
+        total_examples = 0
+        novelty_history = []
+        
+        # One worker pool for the whole run, shared by every source
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            while True:
+                while not stopping and len(running) < MAX_CONCURRENT_SOURCES:
+                    next_source = next(queued, None)
+                    if next_source is None:
+                        break
+                    i, source_config = next_source
+                    running.add(asyncio.create_task(self._process_source(
+                        i,
+                        len(sources),
+                        source_config,
+                        quality_threshold,
+                        max_words_per_example,
+                        min_words_per_example,
+                        executor
+                    )))
+                    started += 1
+                
+                if not running:
+                    break
+                
+                # Sources already started always run to completion and are
+                # deduplicated, even once novelty has dried up
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    examples = task.result()
+                    if not examples:
+                        continue
+                    
+                    new_examples = self._deduplicate_examples(examples, self.dedup_index)
+                    unique_examples.extend(new_examples)
+                    total_examples += len(examples)
+                    novelty_history.append(len(new_examples) / len(examples))
+                    
+                    recent = novelty_history[-NOVELTY_WINDOW:]
+                    if (not stopping and started < len(sources)
+                            and len(recent) == NOVELTY_WINDOW
+                            and all(rate < NOVELTY_MIN_RATE for rate in recent)):
+                        print(f"⚠️  Novelty below {NOVELTY_MIN_RATE:.0%} for the last "
+                              f"{NOVELTY_WINDOW} sources; skipping {len(sources) - started} "
+                              f"not yet started")
+                        stopping = True
+        
+        print(f"🔍 Deduplication: {total_examples} → {len(unique_examples)} examples")
+        if self.dedup_index.near_dup_suppressed:
+            print(f"   ♻️  {self.dedup_index.near_dup_suppressed} near-duplicates removed")
         
         # Create dataset
+        stats = self._calculate_dataset_stats(
+            unique_examples, self.dedup_index.near_dup_suppressed
+        )
         dataset = TrainingDataset(
             name=dataset_name,
             description=f"Training dataset created from {len(sources)} sources",
             examples=unique_examples,
-            total_words=sum(ex.word_count for ex in unique_examples),
+            total_words=stats.get('total_words', 0),
             quality_threshold=quality_threshold,
             created_at=datetime.now(),
-            stats=self._calculate_dataset_stats(unique_examples)
+            stats=stats
         )
         
         self.datasets.append(dataset)
@@ -263,114 +577,164 @@ class LLMTrainingDataGenerator:
         
         return params
     
-    def _process_pages_for_training(
+    async def _process_source(
         self,
-        pages: List[Dict[str, Any]],
+        index: int,
+        total: int,
         source_config: Dict[str, Any],
         quality_threshold: float,
         max_words: int,
-        min_words: int
+        min_words: int,
+        executor: ProcessPoolExecutor
     ) -> List[TrainingExample]:
-        """Process crawled pages into training examples."""
+        """Crawl a single source collection and turn its pages into examples."""
+        print(f"\n📖 Processing source {index+1}/{total}: {source_config.get('name', 'Unknown')}")
         
-        examples = []
-        category = source_config.get('category', 'general')
+        # Start crawl with training-optimized parameters
+        crawl_params = self._get_training_crawl_params(source_config)
         
-        for page in pages:
-            content = page.get('content', '')
-            word_count = page.get('word_count', 0)
-            quality_score = page.get('quality_score', 0.5)
-            
-            # Filter by quality and length
-            if quality_score < quality_threshold:
-                continue
-                
-            if word_count < min_words or word_count > max_words:
-                continue
-            
-            # Clean and normalize content
-            cleaned_content = self._clean_content_for_training(content)
-            
-            if not cleaned_content or len(cleaned_content.split()) < min_words:
-                continue
-            
-            # Create training example
-            example = TrainingExample(
-                text=cleaned_content,
-                source=page.get('url', ''),
-                title=page.get('title', ''),
-                word_count=len(cleaned_content.split()),
-                quality_score=quality_score,
-                category=category,
-                metadata={
-                    'source_domain': source_config.get('name', ''),
-                    'crawled_at': datetime.now().isoformat(),
-                    'reading_time': page.get('reading_time', 0),
-                    'has_code': 'code_blocks' in page and len(page['code_blocks']) > 0
-                }
-            )
-            
-            examples.append(example)
-        
-        return examples
-    
-    def _clean_content_for_training(self, content: str) -> str:
-        """Clean content for LLM training."""
+        job = await self.crawler.crawl(
+            start_url=source_config['url'],
+            **crawl_params
+        )
         
-        # Remove excessive whitespace
-        lines = [line.strip() for line in content.split('\n')]
-        lines = [line for line in lines if line]  # Remove empty lines
+        print(f"   🔄 Crawling started (Job: {job.job_id})")
         
-        # Join with proper spacing
-        cleaned = '\n'.join(lines)
+        # Consume pages as they arrive, holding at most one batch in memory
+        examples = []
+        batch = []
+        async for page in self._stream_pages(job.job_id):
+            batch.append(page)
+            if len(batch) < STREAM_BATCH_PAGES:
+                continue
+            examples.extend(await self._process_pages_for_training(
+                batch, source_config, quality_threshold, max_words, min_words, executor
+            ))
+            batch = []
         
-        # Remove duplicate consecutive lines
-        prev_line = ""
-        result_lines = []
-        for line in cleaned.split('\n'):
-            if line != prev_line:
-                result_lines.append(line)
-                prev_line = line
+        if batch:
+            examples.extend(await self._process_pages_for_training(
+                batch, source_config, quality_threshold, max_words, min_words, executor
+            ))
         
-        return '\n'.join(result_lines)
+        print(f"   ✅ Generated {len(examples)} training examples")
+        return examples
+    
+    async def _stream_pages(self, job_id: str):
+        """Yield a job's pages, streaming when the client supports it."""
+        if hasattr(self.crawler, 'iter_pages'):
+            async for page in self.crawler.iter_pages(job_id):
+                yield page
+            return
+        
+        results = await self.crawler.wait_for_completion(job_id)
+        for page in results.pages:
+            yield page
     
-    def _deduplicate_examples(self, examples: List[TrainingExample]) -> List[TrainingExample]:
-        """Remove duplicate examples based on content hash."""
+    async def _process_pages_for_training(
+        self,
+        pages: List[Dict[str, Any]],
+        source_config: Dict[str, Any],
+        quality_threshold: float,
+        max_words: int,
+        min_words: int,
+        executor: ProcessPoolExecutor
+    ) -> List[TrainingExample]:
+        """Process crawled pages into training examples."""
         
-        seen_hashes = set()
-        unique_examples = []
+        # Filter by quality and length before any per-page work
+        pages = _filter_pages(pages, quality_threshold, max_words, min_words)
+        
+        # Cleaning and hashing are CPU-bound and independent per page; spread
+        # large batches across the pool's cores, and keep small ones off the
+        # loop so other sources keep polling
+        if len(pages) >= PARALLEL_MIN_PAGES:
+            loop = asyncio.get_running_loop()
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, _pages_to_examples,
+                    pages[i:i + PARALLEL_CHUNK_PAGES], source_config, min_words
+                )
+                for i in range(0, len(pages), PARALLEL_CHUNK_PAGES)
+            ))
+            return [example for chunk in chunks for example in chunk]
+        
+        return await asyncio.to_thread(_pages_to_examples, pages, source_config, min_words)
+    
+    def _deduplicate_examples(
+        self,
+        examples: List[TrainingExample],
+        index: Optional[NearDuplicateIndex] = None
+    ) -> List[TrainingExample]:
+        """Remove exact and near-duplicate examples."""
         
-        for example in examples:
-            if example.hash not in seen_hashes:
-                seen_hashes.add(example.hash)
-                unique_examples.append(example)
+        if index is None:
+            index = NearDuplicateIndex()
         
-        return unique_examples
+        return [example for example in examples if index.add(example)]
     
-    def _calculate_dataset_stats(self, examples: List[TrainingExample]) -> Dict[str, Any]:
+    def _calculate_dataset_stats(
+        self,
+        examples: List[TrainingExample],
+        near_dup_suppressed: int = 0
+    ) -> Dict[str, Any]:
         """Calculate statistics for the dataset."""
         
         if not examples:
             return {}
         
-        word_counts = [ex.word_count for ex in examples]
-        quality_scores = [ex.quality_score for ex in examples]
-        
-        # Category distribution
-        categories = {}
-        for ex in examples:
-            categories[ex.category] = categories.get(ex.category, 0) + 1
+        if HAS_NUMPY:
+            # Numeric columns are reduced as arrays; count the string
+            # columns with C-level Counter and set comprehension passes
+            categories = Counter(ex.category for ex in examples)
+            sources = {ex.source for ex in examples}
+            word_counts, quality_scores = _numeric_columns(examples)
+            if HAS_NUMBA and len(examples) >= NUMBA_MIN_EXAMPLES:
+                (total_words, min_words, max_words,
+                 quality_total, min_quality, max_quality) = _reduce_stats(word_counts, quality_scores)
+            else:
+                total_words, min_words, max_words = word_counts.sum(), word_counts.min(), word_counts.max()
+                quality_total, min_quality, max_quality = (
+                    quality_scores.sum(), quality_scores.min(), quality_scores.max()
+                )
+            total_words, min_words, max_words = int(total_words), int(min_words), int(max_words)
+            min_quality, max_quality = float(min_quality), float(max_quality)
+            avg_words, avg_quality = total_words / len(examples), float(quality_total) / len(examples)
+        else:
+            # Single fused pass over the examples for every accumulator
+            categories = Counter()
+            sources = set()
+            total_words, quality_total = 0, 0.0
+            min_words, max_words = float('inf'), float('-inf')
+            min_quality, max_quality = float('inf'), float('-inf')
+            for ex in examples:
+                words, quality = ex.word_count, ex.quality_score
+                total_words += words
+                quality_total += quality
+                if words < min_words:
+                    min_words = words
+                if words > max_words:
+                    max_words = words
+                if quality < min_quality:
+                    min_quality = quality
+                if quality > max_quality:
+                    max_quality = quality
+                categories[ex.category] += 1
+                sources.add(ex.source)
+            avg_words, avg_quality = total_words / len(examples), quality_total / len(examples)
         
         return {
             'total_examples': len(examples),
-            'avg_words_per_example': sum(word_counts) / len(word_counts),
-            'min_words': min(word_counts),
-            'max_words': max(word_counts),
-            'avg_quality': sum(quality_scores) / len(quality_scores),
-            'min_quality': min(quality_scores),
-            'max_quality': max(quality_scores),
-            'categories': categories,
-            'total_unique_sources': len(set(ex.source for ex in examples))
+            'total_words': total_words,
+            'avg_words_per_example': avg_words,
+            'min_words': min_words,
+            'max_words': max_words,
+            'avg_quality': avg_quality,
+            'min_quality': min_quality,
+            'max_quality': max_quality,
+            'categories': dict(categories),
+            'total_unique_sources': len(sources),
+            'near_dup_suppressed': near_dup_suppressed
         }
     
     def export_dataset(
@@ -417,12 +781,12 @@ class LLMTrainingDataGenerator:
             
             elif fmt == 'parquet':
                 try:
-                    import pandas as pd
+                    import pyarrow
                     filepath = os.path.join(output_dir, f"{base_filename}.parquet")
                     self._export_parquet(dataset, filepath)
                     output_files['parquet'] = filepath
                 except ImportError:
-                    print("⚠️  Pandas not available, skipping Parquet export")
+                    print("⚠️  PyArrow not available, skipping Parquet export")
         
         # Export metadata
         metadata_path = os.path.join(output_dir, f"{base_filename}_metadata.json")
@@ -433,15 +797,40 @@ class LLMTrainingDataGenerator:
     
     def _export_jsonl(self, dataset: TrainingDataset, filepath: str):
         """Export dataset as JSONL (JSON Lines) format."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for example in dataset.examples:
-                json.dump(asdict(example), f, ensure_ascii=False)
-                f.write('\n')
+        buf = bytearray()
+        
+        # Rows are coalesced into one buffer and handed over per
+        # JSONL_FLUSH_BYTES; the buffered writer retries short writes
+        with open(filepath, 'wb') as f:
+            for ex in dataset.examples:
+                buf += _json_line(ex.to_dict())
+                
+                if len(buf) >= JSONL_FLUSH_BYTES:
+                    f.write(buf)
+                    buf.clear()
+            
+            f.write(buf)
     
     def _export_json(self, dataset: TrainingDataset, filepath: str):
-        """Export dataset as JSON format."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(asdict(dataset), f, indent=2, ensure_ascii=False, default=str)
+        """Export dataset as JSON format, streaming examples one at a time."""
+        header = {
+            'name': dataset.name,
+            'description': dataset.description,
+            'total_words': dataset.total_words,
+            'quality_threshold': dataset.quality_threshold,
+            'created_at': dataset.created_at.isoformat(),
+            'stats': dataset.stats
+        }
+        
+        with open(filepath, 'wb') as f:
+            # Reopen the header object to append the streamed examples array
+            f.write(_json_bytes(header)[:-1])
+            f.write(b',"examples":[')
+            for i, ex in enumerate(dataset.examples):
+                if i:
+                    f.write(b',')
+                f.write(_json_bytes(ex.to_dict()))
+            f.write(b']}')
     
     def _export_txt(self, dataset: TrainingDataset, filepath: str):
         """Export dataset as plain text (concatenated examples)."""
@@ -454,17 +843,41 @@ class LLMTrainingDataGenerator:
                 f.write("\n\n" + "="*80 + "\n\n")
     
     def _export_parquet(self, dataset: TrainingDataset, filepath: str):
-        """Export dataset as Parquet format."""
-        import pandas as pd
-        
-        data = []
-        for example in dataset.examples:
-            row = asdict(example)
-            row['metadata'] = json.dumps(row['metadata'])
-            data.append(row)
+        """Export dataset as Parquet format, built column by column."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        examples = dataset.examples
+        word_counts, quality_scores = _numeric_columns(examples)
+        
+        table = pa.Table.from_arrays(
+            [
+                pa.array([ex.text for ex in examples], type=pa.large_string()),
+                pa.array([ex.source for ex in examples], type=pa.string()),
+                pa.array([ex.title for ex in examples], type=pa.string()),
+                pa.array(word_counts, type=pa.int64()),
+                pa.array(quality_scores, type=pa.float64()),
+                pa.array([ex.category for ex in examples], type=pa.string()),
+                pa.array([_json_bytes(ex.metadata).decode('utf-8') for ex in examples], type=pa.string()),
+                pa.array([ex.hash_hex for ex in examples], type=pa.string())
+            ],
+            names=['text', 'source', 'title', 'word_count', 'quality_score',
+                   'category', 'metadata', 'hash']
+        )
         
-        df = pd.DataFrame(data)
-        df.to_parquet(filepath, index=False)
+        # Small row groups let dataloaders stream shards; dictionary-encode
+        # the low-cardinality columns
+        pq.write_table(
+            table,
+            filepath,
+            compression='zstd',
+            compression_level=3,
+            row_group_size=PARQUET_ROW_GROUP_ROWS,
+            data_page_version='2.0',
+            use_dictionary=['category', 'source'],
+            write_statistics=True,
+            write_batch_size=1024
+        )
     
     def _export_metadata(self, dataset: TrainingDataset, filepath: str):
         """Export dataset metadata."""
@@ -4,12 +4,33 @@ Demonstrate the new readable formats with side-by-side comparison.
 """
 
 import asyncio
+import os
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'app'))
 from app import CrawlConfig, WebCrawler
 
+# Text previews only need the head of the file, however large the crawl output
+PREVIEW_READ_BYTES = 4096
+
+# (format, description) pairs generated by the demo
+FORMATS = (
+    ('json', 'Structured data for APIs/processing'),
+    ('markdown', 'Standard markdown for documentation'),
+    ('readable', 'Human-friendly text for LLMs'),
+    ('summary', 'Executive summary with analysis'),
+)
+
+# (file pattern, title, file type, preview length) per generated format
+FORMAT_EXAMPLES = (
+    ('json/crawl_results.json', 'JSON Format', 'json', 300),
+    ('markdown/*.md', 'Markdown Format', 'text', 400),
+    ('readable/crawl_content_readable.txt', 'Readable Format', 'text', 500),
+    ('summary/crawl_summary.md', 'Summary Format', 'text', 400),
+)
+
 async def demo_format_comparison():
     """Demo all formats with the same content for comparison."""
     
@@ -19,36 +40,49 @@ async def demo_format_comparison():
     # Use a smaller documentation site for quick demo
     test_url = "https://rich.readthedocs.io/en/stable/"
     
-    formats = [
-        ('json', 'Structured data for APIs/processing'),
-        ('markdown', 'Standard markdown for documentation'),
-        ('readable', 'Human-friendly text for LLMs'),
-        ('summary', 'Executive summary with analysis')
-    ]
+    config = CrawlConfig(
+        start_url=test_url,
+        max_pages=2,
+        max_depth=1,
+        same_domain=True,
+        output_dir='format_demo',
+        verbose=False,
+        delay=0.5
+    )
     
-    for fmt, description in formats:
+    # Crawl once, then render the same pages in every format
+    crawler = WebCrawler(config)
+    pages = await crawler.crawl_pages()
+    print(f"\n🌐 Crawled {len(pages)} pages")
+    
+    for fmt, description in FORMATS:
         print(f"\n🔄 Generating {fmt} format...")
         print(f"   {description}")
         
-        config = CrawlConfig(
-            start_url=test_url,
-            max_pages=2,
-            max_depth=1,
-            same_domain=True,
-            output_dir=f'format_demo/{fmt}',
-            export_format=fmt,
-            verbose=False,
-            delay=0.5
-        )
-        
-        crawler = WebCrawler(config)
-        summary = await crawler.crawl()
+        await crawler.export(pages, fmt, f'format_demo/{fmt}')
         
-        print(f"   ✅ Generated: {summary['stats']['pages_crawled']} pages")
-        
-        await asyncio.sleep(1)  # Be respectful
+        print(f"   ✅ Generated: {len(pages)} pages")
     
-    return formats
+    return FORMATS
+
+def index_outputs(root: Path) -> tuple:
+    """Scan an output directory once; bucket files by suffix and record their sizes."""
+    index = defaultdict(list)
+    sizes = {}
+    pending = [root]
+    while pending:
+        try:
+            entries = sorted(os.scandir(pending.pop()), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                pending.append(entry.path)
+            elif entry.is_file():
+                path = Path(entry.path)
+                index[path.suffix].append(path)
+                sizes[path] = entry.stat().st_size
+    return index, sizes
 
 def show_format_examples():
     """Show examples from each format."""
@@ -57,22 +91,19 @@ def show_format_examples():
     print("=" * 50)
     
     base_dir = Path('format_demo')
+    outputs, sizes = index_outputs(base_dir)
     
-    examples = [
-        ('json/crawl_results.json', 'JSON Format', 'json', 300),
-        ('markdown/*.md', 'Markdown Format', 'text', 400),
-        ('readable/crawl_content_readable.txt', 'Readable Format', 'text', 500),
-        ('summary/crawl_summary.md', 'Summary Format', 'text', 400)
-    ]
-    
-    for file_pattern, title, file_type, preview_length in examples:
+    for file_pattern, title, file_type, preview_length in FORMAT_EXAMPLES:
         print(f"\n📄 {title}")
         print("-" * 30)
         
         if '*' in file_pattern:
-            # Find files with wildcard
-            pattern_parts = file_pattern.split('*')
-            matching_files = list(base_dir.glob(file_pattern))
+            # Resolve wildcards against the directory index
+            pattern_path = base_dir / file_pattern
+            matching_files = [
+                path for path in outputs.get(pattern_path.suffix, [])
+                if path.parent == pattern_path.parent
+            ]
             
             if matching_files:
                 file_path = matching_files[0]
@@ -82,15 +113,14 @@ def show_format_examples():
         else:
             file_path = base_dir / file_pattern
         
-        if file_path.exists():
+        if file_path in sizes:
+            print(f"   📁 {file_path.relative_to(base_dir)}")
             try:
-                content = file_path.read_text(encoding='utf-8')
-                
                 if file_type == 'json':
                     # Show formatted JSON structure
                     import json
                     try:
-                        data = json.loads(content)
+                        data = json.loads(file_path.read_bytes())
                         if isinstance(data, list) and len(data) > 0:
                             first_page = data[0]
                             print(f"   📊 Structure: {len(data)} pages")
@@ -101,8 +131,10 @@ def show_format_examples():
                         print("   ❌ Invalid JSON")
                 
                 else:
-                    # Show text preview
-                    lines = content.split('\n')[:10]  # First 10 lines
+                    # Show text preview from a bounded prefix of the file
+                    with file_path.open('rb') as f:
+                        head = f.read(PREVIEW_READ_BYTES).decode('utf-8', errors='replace')
+                    lines = head.split('\n')[:10]  # First 10 lines
                     preview = '\n'.join(lines)
                     
                     if len(preview) > preview_length:
@@ -113,9 +145,8 @@ def show_format_examples():
                         if line.strip():
                             print(f"   │ {line[:80]}")
                 
-                # Show file stats
-                size = file_path.stat().st_size
-                print(f"   📊 File size: {size:,} bytes")
+                # Show file stats recorded during the directory scan
+                print(f"   📊 File size: {sizes[file_path]:,} bytes")
                 
             except Exception as e:
                 print(f"   ❌ Error reading file: {e}")
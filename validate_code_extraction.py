@@ -3,60 +3,142 @@
 Validate code extraction quality and markdown formatting.
 """
 
+import hashlib
+import mmap
+import os
+import pickle
 import re
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+# Below this many files, worker start-up costs more than the scan itself
+PARALLEL_MIN_FILES = 8
+
+# Files submitted to the pool ahead of the one being reported, which bounds
+# how far the directory walk is read ahead
+PARALLEL_WINDOW = 4 * (os.cpu_count() or 1)
+
+# Per-file analysis cache; bump CACHE_VERSION whenever the analysis output changes
+CACHE_DIR = Path('.cache') / 'validate_code_extraction'
+CACHE_VERSION = 2
+
+# Markdown code patterns, compiled once for every file analyzed. Fences and
+# backticks are ASCII, so files are scanned as raw bytes without decoding.
+_RE_INLINE = re.compile(rb'`[^`\n]+`')
+_RE_LANG = re.compile(rb'```(\w+)')
+_RE_NON_SPACE = re.compile(rb'\S')
+
+def scan_markdown(content, max_spans: int = 3):
+    """Walk content (bytes or mmap) once, pairing ``` fences into code blocks."""
+    fences = 0
+    blocks = []
+    languages = Counter()
+    empty_blocks = 0
+    malformed = 0
+    inline_code = 0
+    
+    open_at = -1
+    body_start = 0
+    prose_start = 0
+    pos = content.find(b'```')
+    
+    while pos != -1:
+        fences += 1
+        
+        if open_at < 0:
+            # Opening fence: inline code only counts in the prose before it
+            inline_code += sum(1 for _ in _RE_INLINE.finditer(content, prose_start, pos))
+            open_at = pos
+            body_start = pos + 3
+            
+            lang = _RE_LANG.match(content, pos)
+            if lang:
+                name = lang.group(1).decode('ascii')
+                languages[name] += 1
+                body_start = lang.end()
+        else:
+            # Closing fence
+            # Spans are only kept for samples; the count comes from the fences
+            if len(blocks) < max_spans:
+                blocks.append((open_at, pos + 3))
+            # The body starts after the opening line, so an info string such as
+            # ```python title="x" does not make an empty block look filled
+            body_from = content.find(b'\n', open_at, pos)
+            if body_from == -1:
+                # Opening and closing fence on one line, e.g. ```js var a = 1;```
+                malformed += 1
+                body_from = body_start
+            if not _RE_NON_SPACE.search(content, body_from, pos):
+                empty_blocks += 1
+            open_at = -1
+            prose_start = pos + 3
+        
+        pos = content.find(b'```', pos + 3)
+    
+    # Trailing prose, including an unclosed block's text
+    inline_code += sum(1 for _ in _RE_INLINE.finditer(content, prose_start))
+    
+    return {
+        'fences': fences,
+        'blocks': blocks,
+        'languages': languages,
+        'empty_blocks': empty_blocks,
+        'malformed': malformed,
+        'inline_code': inline_code
+    }
+
 def analyze_markdown_file(file_path: Path):
     """Analyze a markdown file for code extraction quality."""
     if not file_path.exists():
         return None
     
-    content = file_path.read_text(encoding='utf-8')
-    
-    # Count different code elements
-    code_blocks = len(re.findall(r'```[\s\S]*?```', content, re.MULTILINE))
-    inline_code = len(re.findall(r'`[^`\n]+`', content))
-    
-    # Find languages in code blocks
-    languages = re.findall(r'```(\w+)', content)
-    language_counts = {}
-    for lang in languages:
-        language_counts[lang] = language_counts.get(lang, 0) + 1
+    # Map the file rather than decoding it into a str; mmap rejects empty files
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return analyze_content(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return analyze_content(content)
+
+def analyze_content(content):
+    """Analyze raw markdown bytes for code extraction quality."""
+    scan = scan_markdown(content)
     
     # Check for common issues
     issues = []
     
     # Unclosed code blocks
-    open_blocks = content.count('```')
+    open_blocks = scan['fences']
     if open_blocks % 2 != 0:
         issues.append(f"Unclosed code blocks (found {open_blocks} ``` markers)")
     
     # Empty code blocks
-    empty_blocks = len(re.findall(r'```\s*\n\s*```', content, re.MULTILINE))
+    empty_blocks = scan['empty_blocks']
     if empty_blocks > 0:
         issues.append(f"{empty_blocks} empty code blocks")
     
     # Malformed code blocks (common issue)
-    malformed = len(re.findall(r'```.*```.*```', content, re.DOTALL))
+    malformed = scan['malformed']
     if malformed > 0:
         issues.append(f"Possible malformed code blocks: {malformed}")
     
     return {
         'file_size': len(content),
-        'code_blocks': code_blocks,
-        'inline_code': inline_code,
-        'languages': language_counts,
+        'code_blocks': scan['fences'] // 2,
+        'inline_code': scan['inline_code'],
+        'languages': scan['languages'],
         'issues': issues,
-        'sample_blocks': extract_sample_blocks(content)
+        'sample_blocks': extract_sample_blocks(content, scan['blocks'])
     }
 
-def extract_sample_blocks(content: str, max_samples: int = 3):
-    """Extract sample code blocks for display."""
-    blocks = re.findall(r'```[\s\S]*?```', content, re.MULTILINE)
-    
+def extract_sample_blocks(content, blocks, max_samples: int = 3):
+    """Extract sample code blocks for display from scanned block spans."""
     samples = []
-    for block in blocks[:max_samples]:
-        lines = block.split('\n')
+    for start, end in blocks[:max_samples]:
+        block = content[start:end].decode('utf-8', errors='replace')
+        lines = block.split('\n', 10)  # only need to know whether there are more than 10
         if len(lines) > 10:
             # Truncate long blocks
             sample = '\n'.join(lines[:8]) + '\n... (truncated)'
@@ -66,6 +148,63 @@ def extract_sample_blocks(content: str, max_samples: int = 3):
     
     return samples
 
+def cached_analysis(md_file: Path):
+    """Analyze a file, reusing the cached result while its mtime and size are unchanged."""
+    try:
+        st = md_file.stat()
+    except FileNotFoundError:
+        return None
+    
+    key = (CACHE_VERSION, str(md_file.resolve()), st.st_mtime_ns, st.st_size)
+    entry = CACHE_DIR / (hashlib.sha1(key[1].encode()).hexdigest() + '.pkl')
+    
+    try:
+        with open(entry, 'rb') as f:
+            cached_key, analysis = pickle.load(f)
+        if cached_key == key:
+            return analysis
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass  # Missing or unreadable entry: analyze afresh
+    
+    analysis = analyze_markdown_file(md_file)
+    
+    # Write to a temp file and rename so readers never see a partial entry
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump((key, analysis), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry)
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return analysis
+
+def _analyze_entry(md_file: Path):
+    """Pair a file with its analysis so results can stream out of a pool."""
+    return md_file, cached_analysis(md_file)
+
+def iter_analyses(md_files):
+    """Yield (file, analysis) pairs in walk order as files are discovered."""
+    md_files = iter(md_files)
+    head = list(islice(md_files, PARALLEL_MIN_FILES))
+    if len(head) < PARALLEL_MIN_FILES:
+        yield from map(_analyze_entry, head)
+        return
+    
+    # Files are independent, so analyze them across cores. Only a window of
+    # files is in flight at once (executor.map would drain the whole walk
+    # before returning), and results come back in order for the caller to print
+    with ProcessPoolExecutor() as executor:
+        pending = deque(executor.submit(_analyze_entry, md_file) for md_file in head)
+        for md_file in md_files:
+            if len(pending) >= PARALLEL_WINDOW:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_analyze_entry, md_file))
+        
+        while pending:
+            yield pending.popleft().result()
+
 def main():
     """Run validation on extracted code."""
     print("🔍 Code Extraction Quality Validation")
@@ -77,91 +216,93 @@ def main():
         print("❌ No test output directory found")
         return
     
-    # Find all markdown files
-    md_files = list(test_dir.rglob('*.md'))
-    
-    if not md_files:
-        print("❌ No markdown files found")
-        return
-    
-    print(f"📄 Found {len(md_files)} markdown files")
+    # Stream markdown files from the walk instead of listing them up front
+    print(f"📄 Scanning {test_dir}/ for markdown files")
     print()
     
+    files_seen = 0
     total_code_blocks = 0
     total_inline_code = 0
-    all_languages = {}
-    all_issues = []
+    all_languages = Counter()
+    total_issues = 0
     
-    for md_file in md_files:
+    for md_file, analysis in iter_analyses(test_dir.rglob('*.md')):
+        files_seen += 1
         site_name = md_file.parent.name
-        analysis = analyze_markdown_file(md_file)
         
         if analysis:
-            print(f"📋 {site_name}")
-            print(f"   📄 File: {md_file.name}")
-            print(f"   📊 Size: {analysis['file_size']:,} bytes")
-            print(f"   💻 Code blocks: {analysis['code_blocks']}")
-            print(f"   📝 Inline code: {analysis['inline_code']}")
+            # Build the whole per-file report, then write it in one call
+            report = [
+                f"📋 {site_name} (file {files_seen})",
+                f"   📄 File: {md_file.name}",
+                f"   📊 Size: {analysis['file_size']:,} bytes",
+                f"   💻 Code blocks: {analysis['code_blocks']}",
+                f"   📝 Inline code: {analysis['inline_code']}",
+            ]
             
             if analysis['languages']:
-                print(f"   🔤 Languages: {', '.join(f'{lang}({count})' for lang, count in analysis['languages'].items())}")
+                report.append(f"   🔤 Languages: {', '.join(f'{lang}({count})' for lang, count in analysis['languages'].items())}")
             
             if analysis['issues']:
-                print(f"   ⚠️  Issues: {len(analysis['issues'])}")
+                report.append(f"   ⚠️  Issues: {len(analysis['issues'])}")
                 for issue in analysis['issues'][:2]:  # Show first 2 issues
-                    print(f"      - {issue}")
+                    report.append(f"      - {issue}")
             else:
-                print(f"   ✅ No issues found")
+                report.append(f"   ✅ No issues found")
             
             # Show a sample code block
             if analysis['sample_blocks']:
-                print(f"   🔍 Sample code block:")
+                report.append(f"   🔍 Sample code block:")
                 sample = analysis['sample_blocks'][0]
                 lines = sample.split('\n')
                 for line in lines[:6]:  # Show first 6 lines
-                    print(f"      {line}")
+                    report.append(f"      {line}")
                 if len(lines) > 6:
-                    print(f"      ... ({len(lines) - 6} more lines)")
+                    report.append(f"      ... ({len(lines) - 6} more lines)")
             
-            print()
+            report.append("")
+            sys.stdout.write("\n".join(report) + "\n")
             
             # Accumulate totals
             total_code_blocks += analysis['code_blocks']
             total_inline_code += analysis['inline_code']
             
-            for lang, count in analysis['languages'].items():
-                all_languages[lang] = all_languages.get(lang, 0) + count
+            all_languages.update(analysis['languages'])
             
-            all_issues.extend(analysis['issues'])
+            total_issues += len(analysis['issues'])
+    
+    if not files_seen:
+        print("❌ No markdown files found")
+        return
     
     # Summary
     print("📊 SUMMARY")
     print("=" * 30)
-    print(f"📄 Files analyzed: {len(md_files)}")
+    print(f"📄 Files analyzed: {files_seen}")
     print(f"💻 Total code blocks: {total_code_blocks}")
     print(f"📝 Total inline code: {total_inline_code}")
     print(f"🔤 Programming languages detected: {len(all_languages)}")
     
     if all_languages:
         print("   Language breakdown:")
-        for lang, count in sorted(all_languages.items(), key=lambda x: x[1], reverse=True):
+        for lang, count in all_languages.most_common():
             print(f"   - {lang}: {count} blocks")
     
-    print(f"⚠️  Total issues: {len(all_issues)}")
+    print(f"⚠️  Total issues: {total_issues}")
     
-    if len(all_issues) == 0:
+    if total_issues == 0:
         print("✅ EXCELLENT: All markdown files have valid code block formatting!")
-    elif len(all_issues) < total_code_blocks * 0.1:  # Less than 10% issues
+    elif total_issues < total_code_blocks * 0.1:  # Less than 10% issues
         print("✅ GOOD: Minor formatting issues, mostly valid")
     else:
         print("⚠️  NEEDS IMPROVEMENT: Significant formatting issues found")
     
     # Quality score
     if total_code_blocks > 0:
-        quality_score = max(0, 100 - (len(all_issues) / total_code_blocks * 100))
+        quality_score = max(0, 100 - (total_issues / total_code_blocks * 100))
         print(f"📈 Quality Score: {quality_score:.1f}%")
     
-    print(f"\n🎯 Code extraction is {'WORKING WELL' if len(all_issues) < 10 else 'NEEDS FIXES'}")
+    print(f"\n🎯 Code extraction is {'WORKING WELL' if total_issues < 10 else 'NEEDS FIXES'}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file